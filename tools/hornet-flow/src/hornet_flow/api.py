@@ -4,18 +4,16 @@ This module provides a clean programmatic interface to hornet-flow functionality
 without CLI dependencies. Functions raise core domain exceptions only.
 """
 
-import contextlib
 import logging
 import os
 import platform
+import shlex
 import subprocess
 import sys
 import tempfile
-from functools import wraps
+from functools import cache, cached_property, wraps
 from pathlib import Path
-from typing import Any, TypeAlias
-
-import jsonschema
+from typing import Any, Final, TypeAlias
 
 import hornet_flow
 
@@ -26,10 +24,11 @@ from .exceptions import (
     ApiInputValueError,
     ApiProcessingError,
     ApiValidationError,
+    HornetFlowError,
 )
 from .model import Release
 from .plugins import discover_plugins, get_default_plugin
-from .services import git_service, manifest_service, watcher, workflow_service
+from .services import git_service, manifest_service, workflow_service
 from .services.processor import ManifestProcessor
 from .services.workflow_service import EventDispatcher, WorkflowEvent
 
@@ -48,6 +47,42 @@ __all__: tuple[str, ...] = (
 SuccessCountInt: TypeAlias = int
 TotalCountInt: TypeAlias = int
 
+_CAD_MANIFEST_TYPES: Final[frozenset[str]] = frozenset({"cad", "both"})
+_SIM_MANIFEST_TYPES: Final[frozenset[str]] = frozenset({"sim", "both"})
+_MANIFEST_TYPES: Final[frozenset[str]] = _CAD_MANIFEST_TYPES | _SIM_MANIFEST_TYPES
+_PROCESS_OUTPUT_TAIL_SIZE: Final[int] = 64 * 1024
+# Service exception -> API exception, checked in order (first isinstance match wins)
+_SERVICE_ERRORS: Final[dict[type[Exception], type[HornetFlowError]]] = {
+    ValueError: ApiInputValueError,
+    FileNotFoundError: ApiFileNotFoundError,
+    RuntimeError: ApiProcessingError,
+}
+_INFO_ENV_VARS: Final[tuple[str, ...]] = ("HOME", "TMPDIR")
+_PACKAGE_DIR: Final[str] = os.path.dirname(hornet_flow.__file__)
+_PLUGIN_DIR: Final[str] = os.path.join(_PACKAGE_DIR, "plugins")
+
+
+@cache
+def _runtime_info() -> tuple[str, str]:
+    """Python version and platform description, which cannot change while running.
+
+    platform.platform() may spawn a subprocess, so it is only computed once.
+    """
+    return sys.version.split()[0], platform.platform()
+
+
+def _decode_output(output: str | bytes) -> str:
+    """Decode the tail of captured process output, tolerating non-UTF-8 bytes.
+
+    Only the last _PROCESS_OUTPUT_TAIL_SIZE bytes (characters for str output) are
+    kept: the cause of a failure is at the end, and full output can be megabytes.
+    The cut may split a multi-byte character, which then decodes as U+FFFD.
+    """
+    output = output[-_PROCESS_OUTPUT_TAIL_SIZE:]
+    if isinstance(output, bytes):
+        return output.decode(errors="replace")
+    return output
+
 
 def _create_processing_error(
     e: subprocess.CalledProcessError, operation: str
@@ -55,15 +90,14 @@ def _create_processing_error(
     """Convert subprocess errors to ProcessingError with detailed information."""
     error_details = [f"Failed to {operation}"]
     if e.cmd:
-        error_details.append(f"Command: {' '.join(e.cmd)}")
+        cmd = e.cmd if isinstance(e.cmd, str) else shlex.join(map(str, e.cmd))
+        error_details.append(f"Command: {cmd}")
     error_details.append(f"Exit code: {e.returncode}")
 
     if e.stdout:
-        stdout = e.stdout.decode() if isinstance(e.stdout, bytes) else e.stdout
-        error_details.append(f"stdout: {stdout}")
+        error_details.append(f"stdout: {_decode_output(e.stdout)}")
     if e.stderr:
-        stderr = e.stderr.decode() if isinstance(e.stderr, bytes) else e.stderr
-        error_details.append(f"stderr: {stderr}")
+        error_details.append(f"stderr: {_decode_output(e.stderr)}")
 
     return ApiProcessingError(". ".join(error_details))
 
@@ -76,18 +110,22 @@ def handle_service_exceptions(operation_name: str = "operation"):
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
-            except ValueError as e:
-                raise ApiInputValueError(str(e)) from e
-            except FileNotFoundError as e:
-                raise ApiFileNotFoundError(str(e)) from e
-            except RuntimeError as e:
-                raise ApiProcessingError(str(e)) from e
             except subprocess.CalledProcessError as e:
                 raise _create_processing_error(e, operation_name) from e
-            except jsonschema.ValidationError as e:
-                raise ApiValidationError(
-                    f"Schema validation failed: {e.message}"
-                ) from e
+            except HornetFlowError:
+                raise
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                for service_error_cls, api_error_cls in _SERVICE_ERRORS.items():
+                    if isinstance(e, service_error_cls):
+                        raise api_error_cls(str(e)) from e
+
+                # A jsonschema error can only exist if jsonschema was imported
+                jsonschema = sys.modules.get("jsonschema")
+                if jsonschema and isinstance(e, jsonschema.ValidationError):
+                    raise ApiValidationError(
+                        f"Schema validation failed: {e.message}"
+                    ) from e
+                raise
 
         return wrapper
 
@@ -110,6 +148,7 @@ class WorkflowAPI:
         type_filter: str | None = None,
         name_filter: str | None = None,
         event_dispatcher: EventDispatcher | None = None,
+        clone_cache_dir: str | None = None,
     ) -> tuple[SuccessCountInt, TotalCountInt]:
         """Run a complete workflow to process hornet manifests."""
         return workflow_service.run_workflow(
@@ -123,6 +162,7 @@ class WorkflowAPI:
             type_filter=type_filter,
             name_filter=name_filter,
             event_dispatcher=event_dispatcher,
+            clone_cache_dir=Path(clone_cache_dir) if clone_cache_dir else None,
         )
 
     @handle_service_exceptions("watch operation")
@@ -141,31 +181,30 @@ class WorkflowAPI:
         metadata_filename: str = "metadata.json",
     ) -> None:
         """Watch for metadata.json files and automatically process them."""
+        # Imported here so other commands do not load watchfiles
+        from .services import watcher
+
         inputs_path = Path(inputs_dir).resolve()
         work_path = Path(work_dir).resolve()
 
-        # Validate inputs directory exists
-        if not inputs_path.exists():
-            raise ApiFileNotFoundError(
-                f"Inputs directory does not exist: {inputs_path}"
+        # The watcher validates inputs_path (FileNotFoundError is mapped by the
+        # decorator, NotADirectoryError is an invalid input here)
+        try:
+            watcher.watch_for_metadata(
+                inputs_dir=inputs_path,
+                work_dir=work_path,
+                once=once,
+                plugin=plugin,
+                type_filter=type_filter,
+                name_filter=name_filter,
+                fail_fast=fail_fast,
+                stability_seconds=stability_seconds,
+                recursive=recursive,
+                metadata_filename=metadata_filename,
+                event_dispatcher=event_dispatcher,
             )
-
-        if not inputs_path.is_dir():
-            raise ApiInputValueError(f"Inputs path is not a directory: {inputs_path}")
-
-        watcher.watch_for_metadata(
-            inputs_dir=inputs_path,
-            work_dir=work_path,
-            once=once,
-            plugin=plugin,
-            type_filter=type_filter,
-            name_filter=name_filter,
-            fail_fast=fail_fast,
-            stability_seconds=stability_seconds,
-            recursive=recursive,
-            metadata_filename=metadata_filename,
-            event_dispatcher=event_dispatcher,
-        )
+        except NotADirectoryError as e:
+            raise ApiInputValueError(str(e)) from e
 
 
 class RepoAPI:
@@ -186,6 +225,8 @@ class ManifestAPI:
 
     def validate_schema(self, manifest_path: Path, manifest_type: str) -> None:
         """Validate a manifest schema."""
+        import jsonschema
+
         try:
             manifest_service.validate_manifest_schema(manifest_path)
         except jsonschema.ValidationError as e:
@@ -201,48 +242,47 @@ class ManifestAPI:
         if not cad_manifest and not sim_manifest:
             raise ApiFileNotFoundError("No hornet manifest files found")
 
-        cad_valid = False
-        sim_valid = False
-
-        if cad_manifest:
-            with contextlib.suppress(ApiValidationError):
-                self.validate_schema(cad_manifest, "CAD")
-                cad_valid = True
-
-        if sim_manifest:
-            with contextlib.suppress(ApiValidationError):
-                self.validate_schema(sim_manifest, "SIM")
-                sim_valid = True
+        # Only pass/fail is reported here, so skip building ValidationErrors
+        cad_valid = bool(
+            cad_manifest and manifest_service.is_manifest_schema_valid(cad_manifest)
+        )
+        sim_valid = bool(
+            sim_manifest and manifest_service.is_manifest_schema_valid(sim_manifest)
+        )
 
         return cad_valid, sim_valid
 
     @handle_service_exceptions("manifest show")
     def show(self, repo_path: str, manifest_type: str = "both") -> dict[str, Any]:
         """Get manifest contents."""
+        manifest_type = manifest_type.lower()
+        if manifest_type not in _MANIFEST_TYPES:
+            raise ApiInputValueError(f"Invalid manifest type: {manifest_type}")
+        want_cad = manifest_type in _CAD_MANIFEST_TYPES
+        want_sim = manifest_type in _SIM_MANIFEST_TYPES
+
         repo_dir = Path(repo_path)
         cad_manifest, sim_manifest = manifest_service.find_hornet_manifests(repo_dir)
 
         result = {}
 
         # Check if requested manifests exist
-        if manifest_type.lower() in ["cad", "both"] and not cad_manifest:
-            if manifest_type.lower() == "cad":
-                raise ApiFileNotFoundError("No CAD manifest found")
+        if manifest_type == "cad" and not cad_manifest:
+            raise ApiFileNotFoundError("No CAD manifest found")
 
-        if manifest_type.lower() in ["sim", "both"] and not sim_manifest:
-            if manifest_type.lower() == "sim":
-                raise ApiFileNotFoundError("No SIM manifest found")
+        if manifest_type == "sim" and not sim_manifest:
+            raise ApiFileNotFoundError("No SIM manifest found")
 
         # If both requested but neither found
-        if manifest_type.lower() == "both" and not cad_manifest and not sim_manifest:
+        if manifest_type == "both" and not cad_manifest and not sim_manifest:
             raise ApiFileNotFoundError("No hornet manifest files found")
 
         # Get CAD manifest if requested and exists
-        if manifest_type.lower() in ["cad", "both"] and cad_manifest:
+        if want_cad and cad_manifest:
             result["cad"] = manifest_service.read_manifest_contents(cad_manifest)
 
         # Get SIM manifest if requested and exists
-        if manifest_type.lower() in ["sim", "both"] and sim_manifest:
+        if want_sim and sim_manifest:
             result["sim"] = manifest_service.read_manifest_contents(sim_manifest)
 
         return result
@@ -276,35 +316,17 @@ class ManifestAPI:
     ) -> tuple[SuccessCountInt, TotalCountInt]:
         """Process manifests found in repository."""
         # 1. Find hornet manifests
-        cad_manifest, sim_manifest = manifest_service.find_hornet_manifests(repo_path)
+        hornet_manifests = manifest_service.find_hornet_manifests(repo_path)
+        cad_manifest, sim_manifest = hornet_manifests
 
-        if not cad_manifest and not sim_manifest:
+        manifests = hornet_manifests.found()
+        if not manifests:
             msg = f"No hornet manifest files found in repository at {repo_path}"
             raise ApiFileNotFoundError(msg)
 
-        # 2. Validate manifests
-        validation_errors = []
-
-        if cad_manifest:
-            try:
-                self.validate_schema(cad_manifest, "CAD")
-            except ApiValidationError as e:
-                if fail_fast:
-                    raise
-                validation_errors.append(str(e))
-
-        if sim_manifest:
-            try:
-                self.validate_schema(sim_manifest, "SIM")
-            except ApiValidationError as e:
-                if fail_fast:
-                    raise
-                validation_errors.append(str(e))
-
-        # If we had validation errors and fail_fast is False, log them
-        if validation_errors:
-            for error in validation_errors:
-                _logger.error(error)
+        # 2. Validate manifests (with fail_fast, the decorator maps the first error)
+        for error in manifest_service.validate_manifests(manifests, fail_fast):
+            _logger.error(error)
 
         # 3. Process CAD manifest with plugin
         if cad_manifest:
@@ -345,11 +367,21 @@ class CadAPI:
 class HornetFlowAPI:
     """Main API class containing all hornet-flow functionality."""
 
-    def __init__(self):
-        self.workflow = WorkflowAPI()
-        self.repo = RepoAPI()
-        self.manifest = ManifestAPI()
-        self.cad = CadAPI()
+    @cached_property
+    def workflow(self) -> WorkflowAPI:
+        return WorkflowAPI()
+
+    @cached_property
+    def repo(self) -> RepoAPI:
+        return RepoAPI()
+
+    @cached_property
+    def manifest(self) -> ManifestAPI:
+        return ManifestAPI()
+
+    @cached_property
+    def cad(self) -> CadAPI:
+        return CadAPI()
 
     def info(self) -> dict[str, str | bool | dict[str, Any]]:
         """Get system information including version, Python version, and Git availability.
@@ -383,28 +415,25 @@ class HornetFlowAPI:
             plugins_info = {}
 
         # Get configuration details
-        package_path = Path(hornet_flow.__file__).parent
-        plugin_dir = package_path / "plugins"
-
         config_info = {
-            "package_location": str(package_path),
-            "plugin_directory": str(plugin_dir),
-            "plugin_directory_exists": plugin_dir.exists(),
+            "package_location": _PACKAGE_DIR,
+            "plugin_directory": _PLUGIN_DIR,
+            "plugin_directory_exists": os.path.isdir(_PLUGIN_DIR),
             "temp_directory": tempfile.gettempdir(),
         }
 
         # Get relevant environment variables
-        env_info = {}
-        env_vars = ["HOME", "TMPDIR"]
-        for var in env_vars:
-            value = os.environ.get(var)
-            if value is not None:
-                env_info[var] = value
+        env_info = {
+            var: value
+            for var in _INFO_ENV_VARS
+            if (value := os.environ.get(var)) is not None
+        }
 
+        python_version, platform_name = _runtime_info()
         return {
             "version": __version__,
-            "python_version": sys.version.split()[0],
-            "platform": platform.platform(),
+            "python_version": python_version,
+            "platform": platform_name,
             "git_version": git_version if git_version else False,
             "default_plugin": default_plugin,
             "plugins": plugins_info,
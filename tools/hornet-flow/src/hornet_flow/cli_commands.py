@@ -58,6 +58,13 @@ def workflow_run_cmd(
     work_dir: Annotated[
         str | None, typer.Option("--work-dir", help="Working directory for clones")
     ] = None,
+    cache_dir: Annotated[
+        str | None,
+        typer.Option(
+            "--cache-dir",
+            help="Directory to reuse clones of the same commit across runs",
+        ),
+    ] = None,
     fail_fast: FailFastOption = False,
     plugin: PluginOption = None,
     type_filter: TypeFilterOption = None,
@@ -119,6 +126,7 @@ def workflow_run_cmd(
             plugin=plugin,
             type_filter=type_filter,
             name_filter=name_filter,
+            clone_cache_dir=cache_dir,
         )
 
         progress.update(task, description="Workflow completed successfully")
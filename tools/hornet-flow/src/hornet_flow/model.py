@@ -1,7 +1,9 @@
+import functools
 from dataclasses import dataclass, field
-from typing import Any, Literal, TypeAlias
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias
 
-import jsonschema
+if TYPE_CHECKING:
+    import jsonschema
 
 IDStr: TypeAlias = str  # For clarity in type hints
 
@@ -58,6 +60,15 @@ _metadata_model_schema = {
 }
 
 
+@functools.cache
+def _metadata_validator() -> "jsonschema.protocols.Validator":
+    # Built once; jsonschema.validate() re-checks the schema on every call.
+    # Imported here since jsonschema dominates CLI startup time
+    import jsonschema
+
+    return jsonschema.Draft202012Validator(_metadata_model_schema)
+
+
 @dataclass
 class Release:
     origin: str
@@ -67,5 +78,10 @@ class Release:
 
 
 def validate_metadata_and_get_release(metadata: dict[str, Any]) -> Release:
-    jsonschema.validate(instance=metadata, schema=_metadata_model_schema)
+    import jsonschema
+
+    if error := jsonschema.exceptions.best_match(
+        _metadata_validator().iter_errors(metadata)
+    ):
+        raise error
     return Release(**metadata["release"])
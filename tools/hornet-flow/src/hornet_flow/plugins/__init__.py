@@ -1,5 +1,6 @@
 """Plugin system for hornet-flow manifest processing."""
 
+import functools
 import importlib
 from pathlib import Path
 from typing import Dict, Type
@@ -7,6 +8,15 @@ from typing import Dict, Type
 
 def discover_plugins() -> Dict[str, Type]:
     """Discover all available plugins in the plugins directory."""
+    return dict(_discover_plugins())
+
+
+@functools.cache
+def _discover_plugins() -> Dict[str, Type]:
+    """Import every plugin module and instantiate its plugin classes once per process.
+
+    The plugins ship inside the package, so the set cannot change while running.
+    """
     from .base import HornetFlowPlugin
 
     plugins = {}
@@ -5,8 +5,14 @@ cloning, version checking, and repository information extraction.
 """
 
 import asyncio
+import contextlib
+import hashlib
 import os
+import re
+import shutil
 import subprocess
+import tempfile
+import time
 from pathlib import Path
 from typing import Final
 
@@ -14,6 +20,54 @@ from ..model import Release
 
 _GIT_TIMEOUT: Final[int] = 10
 _GIT_VERSION_TIMEOUT: Final[int] = 5
+_FULL_COMMIT_SHA_RE: Final[re.Pattern[str]] = re.compile(r"[0-9a-f]{40}")
+_COMMIT_SHA_RE: Final[re.Pattern[str]] = re.compile(r"[0-9a-f]{4,40}")
+_CLONE_CACHE_MAX_AGE_SECONDS: Final[float] = 7 * 24 * 60 * 60
+# Names created in the cache dir: "<key>" entries and "<key>.<random>.tmp" partials
+_CLONE_CACHE_ENTRY_RE: Final[re.Pattern[str]] = re.compile(
+    r"[0-9a-f]{64}(\.[a-z0-9_]+\.tmp)?"
+)
+
+
+def _git_clone_args(repo_url: str, target_path: Path) -> list[str]:
+    """Build a shallow, blobless clone command that leaves the worktree empty.
+
+    Blobs are fetched lazily by the subsequent checkout, so only the files of
+    the requested commit are downloaded (not those of every branch tip).
+    """
+    return [
+        "git",
+        "clone",
+        "--quiet",
+        "--depth",
+        "1",
+        "--no-single-branch",
+        "--filter=blob:none",
+        "--no-checkout",
+        repo_url,
+        str(target_path),
+    ]
+
+
+def _git_clone_branch_args(repo_url: str, branch: str, target_path: Path) -> list[str]:
+    """Build a shallow, blobless clone command that checks out a branch or tag."""
+    return [
+        "git",
+        "clone",
+        "--quiet",
+        "--depth",
+        "1",
+        "--filter=blob:none",
+        "--branch",
+        branch,
+        repo_url,
+        str(target_path),
+    ]
+
+
+def _may_be_commit_hash(commit_hash: str) -> bool:
+    """Whether commit_hash looks like a (possibly abbreviated) commit SHA."""
+    return _COMMIT_SHA_RE.fullmatch(commit_hash) is not None
 
 
 async def _run_git_command_async(
@@ -81,52 +135,155 @@ async def check_git_version_async() -> str | None:
     )
 
 
-def clone_repository(repo_url: str, commit_hash: str, target_dir: Path | str) -> Path:
-    """Clone repository and checkout specific commit."""
-    if not repo_url.startswith("http://") and not repo_url.startswith("https://"):
-        raise ValueError(f"Repository URL must be HTTP(S): {repo_url}")
+def _run_git_quietly(args: list[str], cwd: Path | None = None) -> None:
+    """Run a git command whose output is not needed.
 
-    target_path = Path(target_dir)
-    target_path.mkdir(parents=True, exist_ok=True)
+    Stdout is discarded rather than buffered; stderr is kept for diagnostics.
 
-    # Clone with depth 1 first
+    Raises:
+        subprocess.CalledProcessError: If git command fails (stderr attached)
+    """
     subprocess.run(
-        [
-            "git",
-            "clone",
-            "--depth",
-            "1",
-            "--no-single-branch",
-            repo_url,
-            str(target_path),
-        ],
-        check=True,
-        capture_output=True,
+        args, cwd=cwd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
     )
 
+
+def _clone_and_checkout(repo_url: str, commit_hash: str, target_path: Path) -> None:
+    """Clone repo_url into target_path and checkout commit_hash.
+
+    Raises:
+        subprocess.CalledProcessError: If a git command fails
+    """
+    if not _may_be_commit_hash(commit_hash):
+        # Branch or tag: clone and checkout in a single git process
+        with contextlib.suppress(subprocess.CalledProcessError):
+            _run_git_quietly(_git_clone_branch_args(repo_url, commit_hash, target_path))
+            return
+
+    # Clone with depth 1 first
+    _run_git_quietly(_git_clone_args(repo_url, target_path))
+
     # Try to checkout the commit, if it fails, fetch it specifically
     try:
-        subprocess.run(
-            ["git", "checkout", commit_hash],
-            cwd=str(target_path),
-            check=True,
-            capture_output=True,
-        )
+        _run_git_quietly(["git", "checkout", "--quiet", commit_hash], cwd=target_path)
     except subprocess.CalledProcessError:
         # Commit not in shallow clone, fetch it specifically
-        subprocess.run(
-            ["git", "fetch", "--depth", "1", "origin", commit_hash],
-            cwd=str(target_path),
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "checkout", commit_hash],
-            cwd=str(target_path),
-            check=True,
-            capture_output=True,
+        _run_git_quietly(
+            ["git", "fetch", "--quiet", "--depth", "1", "origin", commit_hash],
+            cwd=target_path,
         )
+        _run_git_quietly(["git", "checkout", "--quiet", commit_hash], cwd=target_path)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink src to dst, falling back to a copy across filesystems."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _copy_git_dir(src_git_dir: Path, dst_git_dir: Path) -> None:
+    """Copy a git directory, hardlinking only its object store.
+
+    Objects and packs are never modified in place, so sharing their inodes is
+    safe. Everything else (refs, logs, index, config...) may be appended to or
+    rewritten in place by git and is copied so the source is never touched.
+    """
+    objects_prefix = os.path.join(src_git_dir, "objects", "")
+
+    def _copy(src: str, dst: str) -> None:
+        if src.startswith(objects_prefix):
+            _link_or_copy(src, dst)
+        else:
+            shutil.copy2(src, dst)
+
+    shutil.copytree(src_git_dir, dst_git_dir, copy_function=_copy)
 
+
+def _evict_unused_clones(cache_dir: Path) -> None:
+    """Remove cached clones (and leftover partial ones) not used for a while.
+
+    Only names created by _get_cached_clone are considered, so unrelated
+    directories in a shared cache_dir are never deleted.
+    """
+    oldest_mtime = time.time() - _CLONE_CACHE_MAX_AGE_SECONDS
+    with contextlib.suppress(FileNotFoundError), os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if not _CLONE_CACHE_ENTRY_RE.fullmatch(entry.name):
+                continue
+            with contextlib.suppress(OSError):
+                if (
+                    entry.is_dir(follow_symlinks=False)
+                    and entry.stat(follow_symlinks=False).st_mtime < oldest_mtime
+                ):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def _get_cached_clone(repo_url: str, commit_hash: str, cache_dir: Path) -> Path:
+    """Return the cached clone of repo_url at commit_hash, cloning it on a miss.
+
+    Raises:
+        subprocess.CalledProcessError: If a git command fails
+        OSError: If the clone cannot be moved into the cache
+    """
+    key = hashlib.sha256(f"{repo_url}@{commit_hash}".encode()).hexdigest()
+    cached_path = cache_dir / key
+    if cached_path.exists():
+        # Marks the entry as recently used, see _evict_unused_clones
+        with contextlib.suppress(OSError):
+            os.utime(cached_path)
+        return cached_path
+
+    _evict_unused_clones(cache_dir)
+
+    # Clone next to the entry and rename it, so no run ever sees a partial clone
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(tempfile.mkdtemp(prefix=f"{key}.", suffix=".tmp", dir=cache_dir))
+    try:
+        _clone_and_checkout(repo_url, commit_hash, tmp_path)
+        try:
+            tmp_path.rename(cached_path)
+        except OSError:
+            # Only a concurrent run that populated the entry first is expected here
+            if not cached_path.is_dir():
+                raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+    return cached_path
+
+
+def clone_repository(
+    repo_url: str,
+    commit_hash: str,
+    target_dir: Path | str,
+    cache_dir: Path | None = None,
+) -> Path:
+    """Clone repository and checkout specific commit.
+
+    With cache_dir, clones of full commit SHAs are kept there and reused: the
+    target then gets a copy of the cached git directory (with hardlinked
+    objects) instead of being cloned over the network again.
+
+    Raises:
+        ValueError: If repo_url is not an HTTP(S) URL
+        subprocess.CalledProcessError: If a git command fails
+    """
+    if not repo_url.startswith("http://") and not repo_url.startswith("https://"):
+        raise ValueError(f"Repository URL must be HTTP(S): {repo_url}")
+
+    target_path = Path(target_dir)
+    target_path.mkdir(parents=True, exist_ok=True)
+
+    # Branches and tags move, so only immutable commit SHAs are cached
+    if cache_dir is None or not _FULL_COMMIT_SHA_RE.fullmatch(commit_hash):
+        _clone_and_checkout(repo_url, commit_hash, target_path)
+        return target_path
+
+    cached_path = _get_cached_clone(repo_url, commit_hash, cache_dir)
+    _copy_git_dir(cached_path / ".git", target_path / ".git")
+    # Rewrites the index and worktree of the copy, leaving the cache untouched
+    _run_git_quietly(["git", "reset", "--hard", "--quiet"], cwd=target_path)
     return target_path
 
 
@@ -146,33 +303,31 @@ async def clone_repository_async(
     target_path = Path(target_dir)
     target_path.mkdir(parents=True, exist_ok=True)
 
+    if not _may_be_commit_hash(commit_hash):
+        # Branch or tag: clone and checkout in a single git process
+        with contextlib.suppress(subprocess.CalledProcessError):
+            await _run_git_command_async(
+                _git_clone_branch_args(repo_url, commit_hash, target_path)
+            )
+            return target_path
+
     # Clone with depth 1 first
-    await _run_git_command_async(
-        [
-            "git",
-            "clone",
-            "--depth",
-            "1",
-            "--no-single-branch",
-            repo_url,
-            str(target_path),
-        ]
-    )
+    await _run_git_command_async(_git_clone_args(repo_url, target_path))
 
     # Try to checkout the commit, if it fails, fetch it specifically
     try:
         await _run_git_command_async(
-            ["git", "checkout", commit_hash], cwd=str(target_path)
+            ["git", "checkout", "--quiet", commit_hash], cwd=str(target_path)
         )
     except subprocess.CalledProcessError:
         # Commit not in shallow clone, fetch it specifically
         await _run_git_command_async(
-            ["git", "fetch", "--depth", "1", "origin", commit_hash],
+            ["git", "fetch", "--quiet", "--depth", "1", "origin", commit_hash],
             cwd=str(target_path),
         )
 
         await _run_git_command_async(
-            ["git", "checkout", commit_hash], cwd=str(target_path)
+            ["git", "checkout", "--quiet", commit_hash], cwd=str(target_path)
         )
 
     return target_path
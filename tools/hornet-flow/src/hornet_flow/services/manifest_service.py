@@ -5,26 +5,83 @@ finding, validating, reading, and processing manifest contents.
 """
 
 import asyncio
-import json
-from collections.abc import Iterator
+import atexit
+import contextlib
+import functools
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
 
-import httpx
-import jsonschema
+import orjson
 
 from ..model import Component, File
 
+# httpx and jsonschema are imported where used since they dominate CLI startup time
+if TYPE_CHECKING:
+    import httpx
+    import jsonschema
+
+_logger = logging.getLogger(__name__)
+
+_MANIFEST_FILENAMES: Final[tuple[str, str]] = ("cad_manifest.json", "sim_manifest.json")
+_SCHEMA_CACHE_TTL_SECONDS: Final[float] = 24 * 60 * 60
+_SCHEMA_DOWNLOAD_TIMEOUT_SECONDS: Final[float] = 10.0
+# Response validator header -> request header used to revalidate a stale cache entry
+_SCHEMA_VALIDATOR_HEADERS: Final[dict[str, str]] = {
+    "etag": "if-none-match",
+    "last-modified": "if-modified-since",
+}
+_MAX_FILE_CHECK_WORKERS: Final[int] = 32
+# Below this many paths, starting a thread pool costs more than the stat() calls
+_THREADED_STAT_MIN_FILES: Final[int] = 8
+# Above this many paths, listing their directories beats one stat() per file
+_DIR_LISTING_MIN_FILES: Final[int] = 50
+
+# Guards creation of the shared HTTP client (validations run in a thread pool)
+_HTTP_CLIENT_LOCK: Final[threading.Lock] = threading.Lock()
+
+# Compiled validators keyed by $schema URL (shared by sync and async paths)
+_SCHEMA_VALIDATORS: Final[dict[str, "jsonschema.protocols.Validator"]] = {}
+
+
+class HornetManifests(NamedTuple):
+    """Manifest files found in a repository (None when missing)."""
+
+    cad: Path | None
+    sim: Path | None
+
+    def found(self) -> list[tuple[str, Path]]:
+        """Return (label, path) of the manifests that exist, CAD first."""
+        return [
+            (label, manifest)
+            for label, manifest in (("CAD", self.cad), ("SIM", self.sim))
+            if manifest
+        ]
+
+
+class _CachedSchema(NamedTuple):
+    """Schema read from the disk cache, with what is needed to revalidate it."""
+
+    schema: dict[str, Any]
+    is_stale: bool
+    conditional_headers: dict[str, str]
+
 
 def _load_manifest_data(manifest_file: Path) -> dict[str, Any]:
     """Load manifest data from file.
 
     Raises:
-        json.JSONDecodeError: If file is not valid JSON
+        orjson.JSONDecodeError: If file is not valid JSON
         FileNotFoundError: If file does not exist
     """
-    with manifest_file.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(manifest_file.read_bytes())
 
 
 def _extract_schema_url(manifest_data: dict[str, Any], manifest_file: Path) -> str:
@@ -39,39 +96,279 @@ def _extract_schema_url(manifest_data: dict[str, Any], manifest_file: Path) -> s
     return schema_url
 
 
+def _get_schema_cache_dir() -> Path | None:
+    """Return the schema disk cache directory or None if no home can be determined.
+
+    Honours XDG_CACHE_HOME (only absolute paths, as per the XDG spec).
+    """
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache_home and os.path.isabs(xdg_cache_home):
+        cache_home = Path(xdg_cache_home)
+    else:
+        try:
+            cache_home = Path.home() / ".cache"
+        except RuntimeError:
+            return None
+    return cache_home / "hornet-flow" / "schemas"
+
+
+def _get_schema_cache_file(schema_url: str) -> Path | None:
+    if (cache_dir := _get_schema_cache_dir()) is None:
+        return None
+    digest = hashlib.sha256(schema_url.encode()).hexdigest()
+    return cache_dir / f"{digest}.json"
+
+
+def _get_schema_headers_file(schema_url: str) -> Path | None:
+    if (cache_file := _get_schema_cache_file(schema_url)) is None:
+        return None
+    return cache_file.with_suffix(".headers.json")
+
+
+def _read_cached_schema(schema_url: str) -> _CachedSchema | None:
+    """Return schema from the disk cache or None if missing or unreadable.
+
+    The revalidation headers are only read for a stale entry.
+    """
+    if (cache_file := _get_schema_cache_file(schema_url)) is None:
+        return None
+    try:
+        is_stale = time.time() - cache_file.stat().st_mtime > _SCHEMA_CACHE_TTL_SECONDS
+        schema = orjson.loads(cache_file.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    conditional_headers = _read_conditional_headers(schema_url) if is_stale else {}
+    return _CachedSchema(schema, is_stale, conditional_headers)
+
+
+def _write_cache_file(cache_file: Path, content: bytes) -> None:
+    """Write-then-rename so concurrent readers never see a partial file.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f"{cache_file.name}.", suffix=".tmp", dir=cache_file.parent
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_name, cache_file)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _write_cached_schema(
+    schema_url: str, content: bytes, headers: "httpx.Headers"
+) -> None:
+    """Store a downloaded schema and its validators in the disk cache (best effort)."""
+    cache_file = _get_schema_cache_file(schema_url)
+    headers_file = _get_schema_headers_file(schema_url)
+    if cache_file is None or headers_file is None:
+        return
+    validators = {
+        name: headers[name] for name in _SCHEMA_VALIDATOR_HEADERS if name in headers
+    }
+    try:
+        _write_cache_file(cache_file, content)
+        # Written last: validators must never describe a body that was not stored
+        _write_cache_file(headers_file, orjson.dumps(validators))
+    except OSError as e:
+        _logger.debug("Could not cache schema %s: %s", schema_url, e)
+
+
+def _read_conditional_headers(schema_url: str) -> dict[str, str]:
+    """Build If-None-Match/If-Modified-Since headers to revalidate a cached schema."""
+    if (headers_file := _get_schema_headers_file(schema_url)) is None:
+        return {}
+    try:
+        validators = orjson.loads(headers_file.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    return {
+        conditional_name: validators[name]
+        for name, conditional_name in _SCHEMA_VALIDATOR_HEADERS.items()
+        if name in validators
+    }
+
+
+def _handle_schema_response(
+    schema_url: str, response: "httpx.Response", cached: _CachedSchema | None
+) -> dict[str, Any]:
+    """Return the schema from a (conditional) download and update the disk cache.
+
+    Raises:
+        httpx.HTTPStatusError: If the download failed
+        orjson.JSONDecodeError: If the downloaded schema is not valid JSON
+    """
+    if response.status_code == 304 and cached is not None:  # Not Modified
+        if (cache_file := _get_schema_cache_file(schema_url)) is not None:
+            with contextlib.suppress(OSError):
+                # Restart the TTL of the revalidated entry
+                os.utime(cache_file)
+        return cached.schema
+    response.raise_for_status()
+    schema = orjson.loads(response.content)
+    _write_cached_schema(schema_url, response.content, response.headers)
+    return schema
+
+
+def _use_stale_schema(
+    schema_url: str, cached: _CachedSchema | None, error: "httpx.HTTPError"
+) -> dict[str, Any]:
+    """Fall back to a stale cache entry when it cannot be revalidated (e.g. offline).
+
+    Raises:
+        httpx.HTTPError: The download error, if nothing is cached
+    """
+    if cached is None:
+        raise error
+    _logger.warning("Using stale cached schema %s: %s", schema_url, error)
+    return cached.schema
+
+
+def _compile_schema_validator(
+    schema_url: str, schema: dict[str, Any]
+) -> "jsonschema.protocols.Validator":
+    """Compile and memoize a validator for the schema.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    import jsonschema
+
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+    _SCHEMA_VALIDATORS[schema_url] = validator
+    return validator
+
+
+def _http_client() -> "httpx.Client":
+    """Shared client so schema downloads reuse pooled keep-alive connections."""
+    # functools.cache alone lets concurrent first calls each build (and leak) one
+    with _HTTP_CLIENT_LOCK:
+        return _create_http_client()
+
+
+@functools.cache
+def _create_http_client() -> "httpx.Client":
+    import httpx
+
+    client = httpx.Client(timeout=_SCHEMA_DOWNLOAD_TIMEOUT_SECONDS)
+    atexit.register(client.close)
+    return client
+
+
+def _get_schema_validator(schema_url: str) -> "jsonschema.protocols.Validator":
+    """Get compiled validator for schema URL, downloading the schema only on cache miss.
+
+    Raises:
+        httpx.HTTPError: If schema download fails and nothing is cached
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    if validator := _SCHEMA_VALIDATORS.get(schema_url):
+        return validator
+
+    cached = _read_cached_schema(schema_url)
+    if cached is not None and not cached.is_stale:
+        return _compile_schema_validator(schema_url, cached.schema)
+
+    import httpx
+
+    headers = cached.conditional_headers if cached else {}
+    try:
+        response = _http_client().get(schema_url, headers=headers)
+        schema = _handle_schema_response(schema_url, response, cached)
+    except httpx.HTTPError as e:
+        schema = _use_stale_schema(schema_url, cached, e)
+
+    return _compile_schema_validator(schema_url, schema)
+
+
+async def _get_schema_validator_async(
+    schema_url: str,
+) -> "jsonschema.protocols.Validator":
+    """Get compiled validator for schema URL (async version).
+
+    Raises:
+        httpx.HTTPError: If schema download fails and nothing is cached
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    if validator := _SCHEMA_VALIDATORS.get(schema_url):
+        return validator
+
+    cached = await asyncio.to_thread(_read_cached_schema, schema_url)
+    if cached is not None and not cached.is_stale:
+        return await asyncio.to_thread(
+            _compile_schema_validator, schema_url, cached.schema
+        )
+
+    import httpx
+
+    headers = cached.conditional_headers if cached else {}
+    try:
+        async with httpx.AsyncClient(
+            timeout=_SCHEMA_DOWNLOAD_TIMEOUT_SECONDS
+        ) as client:
+            response = await client.get(schema_url, headers=headers)
+        schema = await asyncio.to_thread(
+            _handle_schema_response, schema_url, response, cached
+        )
+    except httpx.HTTPError as e:
+        schema = _use_stale_schema(schema_url, cached, e)
+
+    return await asyncio.to_thread(_compile_schema_validator, schema_url, schema)
+
+
 def _validate_against_schema(
-    manifest_data: dict[str, Any], schema: dict[str, Any]
+    manifest_data: dict[str, Any], validator: "jsonschema.protocols.Validator"
 ) -> None:
-    """Validate manifest data against JSON schema.
+    """Validate manifest data against a compiled JSON schema validator.
 
     Raises:
         jsonschema.ValidationError: If manifest is invalid
     """
-    jsonschema.validate(manifest_data, schema)
+    validator.validate(manifest_data)
+
 
+def _scan_manifest_dir(directory: Path) -> HornetManifests:
+    """Find cad_manifest.json and sim_manifest.json with a single directory listing.
 
-def find_hornet_manifests(repo_path: Path | str) -> tuple[Path | None, Path | None]:
+    Raises:
+        FileNotFoundError: If directory does not exist
+    """
+    names: set[str] = set()
+    with (
+        contextlib.suppress(NotADirectoryError, PermissionError),
+        os.scandir(directory) as entries,
+    ):
+        names = {
+            entry.name
+            for entry in entries
+            if entry.name in _MANIFEST_FILENAMES and entry.is_file()
+        }
+    return HornetManifests._make(
+        directory / name if name in names else None for name in _MANIFEST_FILENAMES
+    )
+
+
+def find_hornet_manifests(repo_path: Path | str) -> HornetManifests:
     """Look for .hornet/cad_manifest.json and .hornet/sim_manifest.json."""
     repo_dir = Path(repo_path)
 
-    cad_manifest: Path | None = None
-    sim_manifest: Path | None = None
-
-    def _check(target: Path):
-        if target.exists() and target.is_file():
-            return target
-        return None
-
     # First check .hornet/ directory otherwise then look in repo root
-    hornet_dir = repo_dir / ".hornet"
-    if hornet_dir.exists():
-        cad_manifest = _check(hornet_dir / "cad_manifest.json")
-        sim_manifest = _check(hornet_dir / "sim_manifest.json")
-    else:
-        cad_manifest = _check(repo_dir / "cad_manifest.json")
-        sim_manifest = _check(repo_dir / "sim_manifest.json")
-
-    return cad_manifest, sim_manifest
+    try:
+        return _scan_manifest_dir(repo_dir / ".hornet")
+    except FileNotFoundError:
+        pass
+    try:
+        return _scan_manifest_dir(repo_dir)
+    except FileNotFoundError:
+        return HornetManifests(None, None)
 
 
 def validate_manifest_schema(manifest_file: Path):
@@ -85,13 +382,54 @@ def validate_manifest_schema(manifest_file: Path):
     manifest_data = _load_manifest_data(manifest_file)
     schema_url = _extract_schema_url(manifest_data, manifest_file)
 
-    # Download schema
-    response = httpx.get(schema_url)
-    response.raise_for_status()
-    schema = response.json()
+    validator = _get_schema_validator(schema_url)
 
     # Validate manifest against schema
-    _validate_against_schema(manifest_data, schema)
+    _validate_against_schema(manifest_data, validator)
+
+
+def is_manifest_schema_valid(manifest_file: Path) -> bool:
+    """Check manifest file against its $schema without building a ValidationError.
+
+    Raises:
+        FileNotFoundError: If no $schema field found
+        httpx.HTTPError: If schema download fails
+    """
+    manifest_data = _load_manifest_data(manifest_file)
+    schema_url = _extract_schema_url(manifest_data, manifest_file)
+
+    return _get_schema_validator(schema_url).is_valid(manifest_data)
+
+
+def validate_manifests(
+    manifests: list[tuple[str, Path]], fail_fast: bool = False
+) -> list[str]:
+    """Validate (label, manifest) pairs concurrently, since each may download its schema.
+
+    Returns:
+        Error messages of the manifests that failed, in input order (CAD first)
+
+    Raises:
+        Exception: The first failure in input order, if fail_fast
+    """
+    import jsonschema
+
+    with ThreadPoolExecutor(max_workers=max(len(manifests), 1)) as executor:
+        validations = [
+            (label, executor.submit(validate_manifest_schema, manifest))
+            for label, manifest in manifests
+        ]
+
+    validation_errors = []
+    for label, validation in validations:
+        try:
+            validation.result()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            if fail_fast:
+                raise
+            reason = e.message if isinstance(e, jsonschema.ValidationError) else e
+            validation_errors.append(f"{label} manifest validation failed: {reason}")
+    return validation_errors
 
 
 async def validate_manifest_schema_async(manifest_file: Path):
@@ -106,20 +444,15 @@ async def validate_manifest_schema_async(manifest_file: Path):
     manifest_data = await asyncio.to_thread(_load_manifest_data, manifest_file)
     schema_url = _extract_schema_url(manifest_data, manifest_file)
 
-    # Download schema asynchronously
-    async with httpx.AsyncClient() as client:
-        response = await client.get(schema_url)
-        response.raise_for_status()
-        schema = response.json()
+    validator = await _get_schema_validator_async(schema_url)
 
     # Validate in thread pool since jsonschema is CPU-bound
-    await asyncio.to_thread(_validate_against_schema, manifest_data, schema)
+    await asyncio.to_thread(_validate_against_schema, manifest_data, validator)
 
 
 def read_manifest_contents(manifest: Path) -> dict[str, Any]:
     """Read and return the JSON contents of a manifest file."""
-    with manifest.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(manifest.read_bytes())
 
 
 def walk_manifest_components(
@@ -127,60 +460,128 @@ def walk_manifest_components(
 ) -> Iterator[Component]:
     """Walk through manifest components and yield Component dataclass instances.
 
+    Components are yielded depth-first in document order. Uses an explicit stack
+    instead of recursion so deep assemblies do not nest generator frames.
+
     Args:
         manifest_data: The loaded manifest JSON data
-        parent_id: List of parent component IDs (path to parent)
+        parent_path: List of parent component IDs (path to parent)
 
     Yields:
         Component: Component dataclass instances with proper parent tracking
     """
-    if parent_path is None:
-        parent_path = []
+    root_path = parent_path or []
+    stack: list[tuple[dict[str, Any], list[str]]] = [
+        (component_dict, root_path)
+        for component_dict in reversed(manifest_data.get("components", []))
+    ]
 
-    # Get components from manifest
-    components = manifest_data.get("components", [])
+    while stack:
+        component_dict, component_parent_path = stack.pop()
 
-    for component_dict in components:
         # Convert file dictionaries to File dataclass instances
         files = [
             File(path=file_dict["path"], type=file_dict["type"])
             for file_dict in component_dict.get("files", [])
         ]
 
-        # Create Component instance
-        component = Component(
+        yield Component(
             id=component_dict["id"],
             type=component_dict["type"],
             description=component_dict["description"],
             files=files,
-            parent_path=parent_path.copy(),
+            parent_path=component_parent_path.copy(),
         )
 
-        # Yield the current component
-        yield component
+        # Push children in reverse so the first child is walked next
+        if child_components := component_dict.get("components"):
+            child_path = component_parent_path + [component_dict["id"]]
+            stack.extend(
+                (child_dict, child_path) for child_dict in reversed(child_components)
+            )
+
 
-        # Recursively walk child components if they exist
-        if "components" in component_dict and component_dict["components"]:
-            # Create new parent path for children
-            child_path = parent_path + [component_dict["id"]]
+def component_file_resolver(
+    manifest_file: Path, repo_dir: Path
+) -> Callable[[str], Path]:
+    """Return a function mapping manifest file paths to full paths.
+
+    The manifest location is resolved once, instead of once per file.
+    """
+    manifest_dir = manifest_file.resolve().parent
 
-            # Create a temporary manifest structure for recursion
-            child_manifest = {"components": component_dict["components"]}
+    def _resolve(file_path: str) -> Path:
+        # NOTE: how path is interpreted
+        if file_path.startswith("./"):
+            return manifest_dir / file_path[2:]
+        return repo_dir / file_path
 
-            yield from walk_manifest_components(child_manifest, child_path)
+    return _resolve
 
 
 def resolve_component_file_path(
     manifest_file: Path, file_path: str, repo_dir: Path
 ) -> Path:
     """Get the full path of a file based on the manifest file location."""
-    # NOTE: how path is interpreted
-    if file_path.startswith("./"):
-        base_dir = manifest_file.resolve().parent
-        file_path = file_path[2:]
-    else:
-        base_dir = repo_dir
-    return base_dir / file_path
+    return component_file_resolver(manifest_file, repo_dir)(file_path)
+
+
+def _stat_existing_files(file_paths: list[Path]) -> set[Path]:
+    """Return the subset of file_paths that exist, checking each with stat().
+
+    Each check is a blocking call that is latency bound on network
+    filesystems or a cold cache, so larger batches are overlapped in a thread pool.
+    """
+    if len(file_paths) < _THREADED_STAT_MIN_FILES:
+        return {file_path for file_path in file_paths if file_path.exists()}
+
+    max_workers = min(_MAX_FILE_CHECK_WORKERS, len(file_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        exists_flags = list(executor.map(os.path.exists, file_paths))
+
+    return {
+        file_path
+        for file_path, exists in zip(file_paths, exists_flags, strict=True)
+        if exists
+    }
+
+
+def _list_entry_names(dir_path: Path) -> frozenset[str]:
+    """Return the names of the non-symlink entries of dir_path.
+
+    Symlinks are left out since their target may not exist.
+    """
+    try:
+        with os.scandir(dir_path) as entries:
+            return frozenset(entry.name for entry in entries if not entry.is_symlink())
+    except OSError:
+        return frozenset()
+
+
+def find_existing_files(file_paths: list[Path]) -> set[Path]:
+    """Return the subset of file_paths that exist.
+
+    Large batches list each parent directory once and look names up in
+    memory; only paths not found that way are stat()ed individually.
+    """
+    if len(file_paths) < _DIR_LISTING_MIN_FILES:
+        return _stat_existing_files(file_paths)
+
+    parent_dirs = list({file_path.parent for file_path in file_paths})
+    max_workers = min(_MAX_FILE_CHECK_WORKERS, len(parent_dirs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        dir_entries = dict(
+            zip(parent_dirs, executor.map(_list_entry_names, parent_dirs), strict=True)
+        )
+
+    existing = {
+        file_path
+        for file_path in file_paths
+        if file_path.name in dir_entries[file_path.parent]
+    }
+    # e.g. symlinks or case-insensitive filesystems
+    unlisted = [file_path for file_path in file_paths if file_path not in existing]
+    return existing | _stat_existing_files(unlisted)
 
 
 def validate_sim_manifest_references(
@@ -4,11 +4,10 @@ This module provides functionality for working with metadata.json files.
 """
 
 import asyncio
-import json
 from pathlib import Path
 from typing import Any
 
-import jsonschema
+import orjson
 
 from ..model import Release, validate_metadata_and_get_release
 
@@ -17,11 +16,10 @@ def _load_metadata_data(metadata_file: Path) -> dict[str, Any]:
     """Load metadata data from file.
 
     Raises:
-        json.JSONDecodeError: If file is not valid JSON
+        orjson.JSONDecodeError: If file is not valid JSON
         FileNotFoundError: If file does not exist
     """
-    with metadata_file.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(metadata_file.read_bytes())
 
 
 def _validate_and_extract_release(
@@ -33,6 +31,8 @@ def _validate_and_extract_release(
         ValueError: If metadata validation fails
         jsonschema.ValidationError: If metadata schema is invalid
     """
+    import jsonschema
+
     try:
         return validate_metadata_and_get_release(metadata)
     except jsonschema.ValidationError as e:
@@ -45,7 +45,7 @@ def load_metadata_release(metadata_path: Path | str) -> Release:
 
     Raises:
         ValueError: If metadata validation fails
-        json.JSONDecodeError: If file is not valid JSON
+        orjson.JSONDecodeError: If file is not valid JSON
         FileNotFoundError: If file does not exist
     """
     metadata_file = Path(metadata_path)
@@ -58,7 +58,7 @@ async def load_metadata_release_async(metadata_path: Path | str) -> Release:
 
     Raises:
         ValueError: If metadata validation fails
-        json.JSONDecodeError: If file is not valid JSON
+        orjson.JSONDecodeError: If file is not valid JSON
         FileNotFoundError: If file does not exist
     """
     metadata_file = Path(metadata_path)
@@ -133,16 +133,33 @@ class ManifestProcessor:
         success_count = 0
         total_count = 0
 
+        # Name matching is case-insensitive; lower the pattern once, not per component
+        name_filter = name_filter.lower() if name_filter else None
+
+        selected_components: list[Component] = []
         for component in manifest_service.walk_manifest_components(manifest_data):
             total_count += 1
 
             # Apply filters
-            if not self._should_process_component(component, type_filter, name_filter):
-                continue
-
-            # Resolve and validate files
-            component_files = self._resolve_component_files(
-                component, manifest_path, repo_path, fail_fast
+            if self._should_process_component(component, type_filter, name_filter):
+                selected_components.append(component)
+
+        # Resolve all files upfront so their existence is checked in one batch
+        resolve_file = manifest_service.component_file_resolver(
+            manifest_path, repo_path
+        )
+        resolved_files = [
+            [resolve_file(file_obj.path) for file_obj in component.files]
+            for component in selected_components
+        ]
+        existing_files = manifest_service.find_existing_files(
+            [file_path for files in resolved_files for file_path in files]
+        )
+
+        for component, component_files in zip(selected_components, resolved_files):
+            # Validate files
+            component_files = self._check_component_files(
+                component_files, existing_files, fail_fast
             )
 
             # Process with plugin
@@ -157,35 +174,38 @@ class ManifestProcessor:
         type_filter: str | None,
         name_filter: str | None,
     ) -> bool:
-        """Check if component should be processed based on filters."""
+        """Check if component should be processed based on filters.
+
+        name_filter is expected in lower case (see _process_components).
+        """
         if type_filter and component.type != type_filter:
             self.logger.debug("Skipping component %s due to type filter", component.id)
             return False
-        if name_filter and name_filter.lower() not in component.id.lower():
+        if name_filter and name_filter not in component.id.lower():
             self.logger.debug("Skipping component %s due to name filter", component.id)
             return False
         return True
 
-    def _resolve_component_files(
+    def _check_component_files(
         self,
-        component: Component,
-        manifest_path: Path,
-        repo_path: Path,
+        component_files: list[Path],
+        existing_files: set[Path],
         fail_fast: bool,
     ) -> list[Path]:
-        """Resolve component file paths and validate existence."""
-        component_files = []
-        for file_obj in component.files:
-            file_path = manifest_service.resolve_component_file_path(
-                manifest_path, file_obj.path, repo_path
-            )
-            if file_path.exists():
-                component_files.append(file_path)
+        """Keep only existing component files, reporting missing ones.
+
+        Raises:
+            FileNotFoundError: If a file is missing and fail_fast is set
+        """
+        checked_files = []
+        for file_path in component_files:
+            if file_path in existing_files:
+                checked_files.append(file_path)
             else:
                 self.logger.error("Missing file: %s", file_path)
                 if fail_fast:
                     raise FileNotFoundError(f"Missing file: {file_path}")
-        return component_files
+        return checked_files
 
     def _process_single_component(
         self, component: Component, component_files: list[Path], fail_fast: bool
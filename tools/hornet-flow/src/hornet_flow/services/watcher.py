@@ -5,6 +5,7 @@ hornet-flow workflow processing when files are detected and stable.
 """
 
 import logging
+import stat
 import time
 from pathlib import Path
 
@@ -25,18 +26,14 @@ def _check_file_stability(file_path: Path, stability_seconds: float = 2.0) -> bo
     Returns:
         True if file is stable, False otherwise
     """
-    if not file_path.exists():
-        return False
-
     try:
         initial_size = file_path.stat().st_size
         time.sleep(stability_seconds)
 
-        if not file_path.exists():
-            return False
-
         final_size = file_path.stat().st_size
         return initial_size == final_size and initial_size > 0
+    except FileNotFoundError:
+        return False
     except OSError as e:
         _logger.error("Error checking file stability for %s: %s", file_path, e)
         return False
@@ -203,13 +200,16 @@ def watch_for_metadata(
 
     Raises:
         FileNotFoundError: If inputs_dir doesn't exist
+        NotADirectoryError: If inputs_dir is not a directory
         PermissionError: If directories can't be accessed
     """
-    # Validate inputs directory
-    if not inputs_dir.exists():
-        raise FileNotFoundError(f"Inputs directory does not exist: {inputs_dir}")
+    # Validate inputs directory (a single stat covers existence and type)
+    try:
+        inputs_stat = inputs_dir.stat()
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise FileNotFoundError(f"Inputs directory does not exist: {inputs_dir}") from e
 
-    if not inputs_dir.is_dir():
+    if not stat.S_ISDIR(inputs_stat.st_mode):
         raise NotADirectoryError(f"Inputs path is not a directory: {inputs_dir}")
 
     # Ensure work directory exists
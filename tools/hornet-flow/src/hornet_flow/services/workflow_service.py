@@ -47,9 +47,8 @@ def _local_repository_dir(
     try:
         yield target_repo_path
     except Exception:
-        # Clean up temporary directory only on failure
-        if temp_path.exists():
-            shutil.rmtree(temp_path)
+        # Clean up temporary directory only on failure, never masking the error
+        shutil.rmtree(temp_path, ignore_errors=True)
         raise
 
 
@@ -101,6 +100,7 @@ def run_workflow(
     type_filter: str | None = None,
     name_filter: str | None = None,
     event_dispatcher: EventDispatcher | None = None,
+    clone_cache_dir: Path | None = None,
 ) -> tuple[int, int]:
     """Run a complete workflow to process hornet manifests.
 
@@ -115,6 +115,7 @@ def run_workflow(
         type_filter: Filter components by type
         name_filter: Filter components by name
         event_dispatcher: Optional event dispatcher for workflow events
+        clone_cache_dir: Optional directory to reuse clones of commits across runs
 
     Returns:
         Tuple of (success_count, total_count)
@@ -154,7 +155,7 @@ def run_workflow(
         release = None
         # 1. Extract release info if needed
         if metadata_file_path:
-            release = metadata_service.load_metadata_release(str(metadata_file_path))
+            release = metadata_service.load_metadata_release(metadata_file_path)
             repo_url = release.url
             repo_commit = release.marker
 
@@ -163,7 +164,9 @@ def run_workflow(
             assert repo_url  # Already validated above
 
             with _local_repository_dir(repo_url, work_dir) as target_repo_path:
-                git_service.clone_repository(repo_url, repo_commit, target_repo_path)
+                git_service.clone_repository(
+                    repo_url, repo_commit, target_repo_path, cache_dir=clone_cache_dir
+                )
 
                 repo_path = target_repo_path
 
@@ -218,36 +221,18 @@ def _process_manifests(
 ) -> tuple[int, int]:
     """Process manifests found in repository."""
     # 1. Find hornet manifests
-    cad_manifest, sim_manifest = manifest_service.find_hornet_manifests(repo_path)
+    hornet_manifests = manifest_service.find_hornet_manifests(repo_path)
+    cad_manifest, sim_manifest = hornet_manifests
 
-    if not cad_manifest and not sim_manifest:
+    manifests = hornet_manifests.found()
+    if not manifests:
         raise FileNotFoundError(
             f"No hornet manifest files found in repository at {repo_path}"
         )
 
     # 2. Validate manifests
-    validation_errors = []
-
-    if cad_manifest:
-        try:
-            manifest_service.validate_manifest_schema(cad_manifest)
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            if fail_fast:
-                raise
-            validation_errors.append(f"CAD manifest validation failed: {e}")
-
-    if sim_manifest:
-        try:
-            manifest_service.validate_manifest_schema(sim_manifest)
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            if fail_fast:
-                raise
-            validation_errors.append(f"SIM manifest validation failed: {e}")
-
-    # Log validation errors if any
-    if validation_errors:
-        for error in validation_errors:
-            _logger.error(error)
+    for error in manifest_service.validate_manifests(manifests, fail_fast):
+        _logger.error(error)
 
     # 3. Trigger manifests ready event
     if event_dispatcher:
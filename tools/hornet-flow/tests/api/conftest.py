@@ -0,0 +1,19 @@
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=too-many-arguments
+# pylint: disable=unused-argument
+# pylint: disable=unused-variable
+
+
+import pytest
+
+from hornet_flow.api import HornetFlowAPI
+
+
+@pytest.fixture(scope="module")
+def api() -> HornetFlowAPI:
+    """Create a HornetFlowAPI instance shared by the tests of a module.
+
+    The API holds no state, so tests patch the services it calls instead.
+    """
+    return HornetFlowAPI()
@@ -5,7 +5,17 @@
 # pylint: disable=unused-variable
 
 
-from hornet_flow.api import EventDispatcher, HornetFlowAPI, WorkflowEvent
+import sys
+
+import pytest
+
+from hornet_flow.api import (
+    EventDispatcher,
+    HornetFlowAPI,
+    WorkflowEvent,
+    handle_service_exceptions,
+)
+from hornet_flow.exceptions import ApiInputValueError
 
 
 def test_api_initialization() -> None:
@@ -57,3 +67,20 @@ def test_api_info() -> None:
     assert "plugin_directory_exists" in config
     assert "temp_directory" in config
     assert isinstance(config["plugin_directory_exists"], bool)
+
+
+def test_handle_service_exceptions_passes_api_errors_through(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """API errors are re-raised as is, without importing jsonschema."""
+    monkeypatch.delitem(sys.modules, "jsonschema", raising=False)
+
+    @handle_service_exceptions("test operation")
+    def _fail() -> None:
+        raise ApiInputValueError("bad input")
+
+    with pytest.raises(ApiInputValueError, match="bad input") as exc_info:
+        _fail()
+
+    assert exc_info.value.__cause__ is None
+    assert "jsonschema" not in sys.modules
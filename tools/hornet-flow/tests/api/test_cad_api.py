@@ -4,18 +4,11 @@
 # pylint: disable=unused-argument
 # pylint: disable=unused-variable
 
-import pytest
 from pytest_mock import MockerFixture
 
 from hornet_flow.api import HornetFlowAPI
 
 
-@pytest.fixture
-def api() -> HornetFlowAPI:
-    """Create a HornetFlowAPI instance for testing."""
-    return HornetFlowAPI()
-
-
 def test_cad_load_basic(mocker: MockerFixture, api: HornetFlowAPI) -> None:
     """Test basic CAD loading from README example."""
     # Setup
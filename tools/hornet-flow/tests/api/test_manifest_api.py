@@ -10,13 +10,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 from hornet_flow.api import HornetFlowAPI
-from hornet_flow.exceptions import ApiFileNotFoundError
-
-
-@pytest.fixture
-def api() -> HornetFlowAPI:
-    """Create a HornetFlowAPI instance for testing."""
-    return HornetFlowAPI()
+from hornet_flow.exceptions import ApiFileNotFoundError, ApiInputValueError
 
 
 def test_manifest_validate_both_valid(
@@ -28,11 +22,11 @@ def test_manifest_validate_both_valid(
         "hornet_flow.services.manifest_service.find_hornet_manifests"
     )
     mock_validate = mocker.patch(
-        "hornet_flow.services.manifest_service.validate_manifest_schema"
+        "hornet_flow.services.manifest_service.is_manifest_schema_valid"
     )
 
     mock_find.return_value = (Path("/repo/cad.json"), Path("/repo/sim.json"))
-    mock_validate.return_value = None  # No exceptions means valid
+    mock_validate.return_value = True
 
     # Execute
     cad_valid, sim_valid = api.manifest.validate("/path/to/repo")
@@ -58,8 +52,30 @@ def test_manifest_validate_no_manifests(
         api.manifest.validate("/path/to/repo")
 
 
-def test_manifest_show_both(mocker: MockerFixture, api: HornetFlowAPI) -> None:
-    """Test showing both manifest types from README example."""
+@pytest.mark.parametrize(
+    "manifest_type, found_manifests, expected",
+    [
+        (
+            "both",
+            (Path("/repo/cad.json"), Path("/repo/sim.json")),
+            {"cad": {"cad_data": "test"}, "sim": {"sim_data": "test"}},
+        ),
+        (
+            "cad",
+            (Path("/repo/cad.json"), None),
+            {"cad": {"cad_data": "test"}},
+        ),
+    ],
+    ids=["both", "cad_only"],
+)
+def test_manifest_show(
+    mocker: MockerFixture,
+    api: HornetFlowAPI,
+    manifest_type: str,
+    found_manifests: tuple[Path | None, Path | None],
+    expected: dict,
+) -> None:
+    """Test showing manifests selected by type from README example."""
     # Setup
     mock_find = mocker.patch(
         "hornet_flow.services.manifest_service.find_hornet_manifests"
@@ -68,36 +84,23 @@ def test_manifest_show_both(mocker: MockerFixture, api: HornetFlowAPI) -> None:
         "hornet_flow.services.manifest_service.read_manifest_contents"
     )
 
-    mock_find.return_value = (Path("/repo/cad.json"), Path("/repo/sim.json"))
+    mock_find.return_value = found_manifests
     mock_read.side_effect = [{"cad_data": "test"}, {"sim_data": "test"}]
 
     # Execute
-    result = api.manifest.show("/path/to/repo", manifest_type="both")
+    result = api.manifest.show("/path/to/repo", manifest_type=manifest_type)
 
     # Verify
-    assert "cad" in result
-    assert "sim" in result
-    assert result["cad"] == {"cad_data": "test"}
-    assert result["sim"] == {"sim_data": "test"}
+    assert result == expected
 
 
-def test_manifest_show_cad_only(mocker: MockerFixture, api: HornetFlowAPI) -> None:
-    """Test showing only CAD manifest."""
-    # Setup
+def test_manifest_show_invalid_type(mocker: MockerFixture, api: HornetFlowAPI) -> None:
+    """Test that an unknown manifest type is rejected before searching the repo."""
     mock_find = mocker.patch(
         "hornet_flow.services.manifest_service.find_hornet_manifests"
     )
-    mock_read = mocker.patch(
-        "hornet_flow.services.manifest_service.read_manifest_contents"
-    )
 
-    mock_find.return_value = (Path("/repo/cad.json"), None)
-    mock_read.return_value = {"cad_data": "test"}
+    with pytest.raises(ApiInputValueError, match="Invalid manifest type"):
+        api.manifest.show("/path/to/repo", manifest_type="all")
 
-    # Execute
-    result = api.manifest.show("/path/to/repo", manifest_type="cad")
-
-    # Verify
-    assert "cad" in result
-    assert "sim" not in result
-    assert result["cad"] == {"cad_data": "test"}
+    mock_find.assert_not_called()
@@ -4,18 +4,14 @@
 # pylint: disable=unused-argument
 # pylint: disable=unused-variable
 
+import subprocess
 from pathlib import Path
 
 import pytest
 from pytest_mock import MockerFixture
 
 from hornet_flow.api import HornetFlowAPI
-
-
-@pytest.fixture
-def api() -> HornetFlowAPI:
-    """Create a HornetFlowAPI instance for testing."""
-    return HornetFlowAPI()
+from hornet_flow.exceptions import ApiProcessingError
 
 
 def test_repo_clone_basic(mocker: MockerFixture, api: HornetFlowAPI) -> None:
@@ -50,3 +46,36 @@ def test_repo_clone_with_defaults(mocker: MockerFixture, api: HornetFlowAPI) ->
     # Verify
     assert repo_path == Path("/tmp/default-repo")
     mock_clone.assert_called_once()
+
+
+def test_repo_clone_git_failure(mocker: MockerFixture, api: HornetFlowAPI) -> None:
+    """Test that a failing git command is reported with its command and stderr."""
+    mock_clone = mocker.patch("hornet_flow.services.git_service.clone_repository")
+    mock_clone.side_effect = subprocess.CalledProcessError(
+        128, "git clone https://example.com/repo", stderr=b"fatal: \xff not found"
+    )
+
+    with pytest.raises(ApiProcessingError) as exc_info:
+        api.repo.clone(repo_url="https://example.com/repo", dest="/tmp/repo")
+
+    message = str(exc_info.value)
+    assert "Command: git clone https://example.com/repo" in message
+    assert "Exit code: 128" in message
+    assert "stderr: fatal: � not found" in message
+
+
+def test_repo_clone_git_failure_keeps_output_tail(
+    mocker: MockerFixture, api: HornetFlowAPI
+) -> None:
+    """Test that only the tail of large git output ends up in the error."""
+    mock_clone = mocker.patch("hornet_flow.services.git_service.clone_repository")
+    mock_clone.side_effect = subprocess.CalledProcessError(
+        128, ["git", "clone"], output=b"x" * 1024 * 1024 + b"fatal: out of space"
+    )
+
+    with pytest.raises(ApiProcessingError) as exc_info:
+        api.repo.clone(repo_url="https://example.com/repo", dest="/tmp/repo")
+
+    message = str(exc_info.value)
+    assert message.endswith("fatal: out of space")
+    assert len(message) < 128 * 1024
@@ -4,7 +4,6 @@
 # pylint: disable=unused-argument
 # pylint: disable=unused-variable
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -14,12 +13,6 @@ from hornet_flow.api import EventDispatcher, HornetFlowAPI, WorkflowEvent
 from hornet_flow.exceptions import ApiFileNotFoundError, ApiInputValueError
 
 
-@pytest.fixture
-def api() -> HornetFlowAPI:
-    """Create a HornetFlowAPI instance for testing."""
-    return HornetFlowAPI()
-
-
 def test_workflow_run_basic(mocker: MockerFixture, api: HornetFlowAPI) -> None:
     """Test basic workflow run from README example."""
     # Setup
@@ -80,14 +73,18 @@ def test_workflow_watch_nonexistent_directory(api: HornetFlowAPI) -> None:
         api.workflow.watch(inputs_dir="/nonexistent/directory", work_dir="/tmp/work")
 
 
-def test_workflow_watch_file_instead_of_directory(api: HornetFlowAPI) -> None:
+def test_workflow_watch_file_instead_of_directory(
+    api: HornetFlowAPI, tmp_path: Path
+) -> None:
     """Test watch with file path instead of directory raises proper exception."""
-    with tempfile.NamedTemporaryFile() as temp_file:
-        with pytest.raises(ApiInputValueError):
-            api.workflow.watch(
-                inputs_dir=temp_file.name,  # File, not directory
-                work_dir="/tmp/work",
-            )
+    inputs_file = tmp_path / "inputs.txt"
+    inputs_file.touch()
+
+    with pytest.raises(ApiInputValueError):
+        api.workflow.watch(
+            inputs_dir=str(inputs_file),  # File, not directory
+            work_dir=str(tmp_path / "work"),
+        )
 
 
 def test_workflow_run_with_event_dispatcher(
@@ -144,10 +141,21 @@ def test_watch_with_event_dispatcher(
     inputs_dir.mkdir()
 
     api.workflow.watch(
-        inputs_dir=str(inputs_dir), work_dir="/tmp/work", event_dispatcher=dispatcher
+        inputs_dir=str(inputs_dir),
+        work_dir=str(tmp_path / "work"),
+        event_dispatcher=dispatcher,
     )
 
     # Verify event dispatcher was passed to watcher
     mock_watch.assert_called_once()
     call_args = mock_watch.call_args
     assert call_args.kwargs["event_dispatcher"] == dispatcher
+
+
+def test_workflow_watch_path_below_file(api: HornetFlowAPI, tmp_path: Path) -> None:
+    """Test watch with a path below a regular file raises proper exception."""
+    inputs_file = tmp_path / "inputs.txt"
+    inputs_file.write_text("not a directory")
+
+    with pytest.raises(ApiFileNotFoundError):
+        api.workflow.watch(inputs_dir=inputs_file / "sub", work_dir=tmp_path / "work")
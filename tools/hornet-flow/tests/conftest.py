@@ -10,11 +10,21 @@ from pathlib import Path
 
 import pytest
 
+from hornet_flow.services import manifest_service
+
 _CURRENT_DIR = Path(
     sys.argv[0] if __name__ == "__main__" else __file__
 ).parent.resolve()
 
 
+@pytest.fixture(autouse=True)
+def schema_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Isolate every test from the user's schema cache and from earlier tests."""
+    monkeypatch.setenv("XDG_CACHE_HOME", f"{tmp_path / 'xdg-cache'}")
+    monkeypatch.setattr(manifest_service, "_SCHEMA_VALIDATORS", {})
+    return tmp_path / "xdg-cache" / "hornet-flow" / "schemas"
+
+
 @pytest.fixture(scope="session")
 def repo_path() -> Path:
     base_path = _CURRENT_DIR.parent.parent.parent
@@ -8,12 +8,25 @@
 import contextlib
 import json
 import logging
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import MagicMock
 
+import httpx
+import orjson
 import pytest
+from pytest_mock import MockerFixture
 
 from hornet_flow import logging_utils, model
-from hornet_flow.services import git_service, manifest_service, metadata_service
+from hornet_flow.services import (
+    git_service,
+    manifest_service,
+    metadata_service,
+    watcher,
+)
+from hornet_flow.services.processor import ManifestProcessor
 
 
 def test_load_metadata_portal_device(tools_hornet_flow_examples_dir: Path):
@@ -36,6 +49,18 @@ def test_load_metadata_portal_device(tools_hornet_flow_examples_dir: Path):
     )
 
 
+def test_load_metadata_missing_release_field(tmp_path: Path):
+    metadata_path = tmp_path / "metadata.json"
+    metadata_path.write_bytes(
+        orjson.dumps(
+            {"release": {"origin": "GitHub", "url": "https://x", "label": "a"}}
+        )
+    )
+
+    with pytest.raises(ValueError, match="'marker' is a required property"):
+        metadata_service.load_metadata_release(metadata_path)
+
+
 @pytest.mark.parametrize(
     "commit_hash", ["main", "ceca2ac4abc8055a7aeaa624ab68a460cd03ff1e"]
 )
@@ -62,6 +87,170 @@ def test_clone_repository(tmp_path: Path, commit_hash: str):
         assert repo_release.marker == commit_hash
 
 
+def test_clone_repository_branch_uses_single_git_process(
+    tmp_path: Path, mocker: MockerFixture
+):
+    mock_run_git = mocker.patch.object(git_service, "_run_git_quietly")
+    repo_url = "https://example.com/org/repo"
+
+    git_service.clone_repository(repo_url, "main", tmp_path / "repo")
+
+    mock_run_git.assert_called_once()
+    assert "--branch" in mock_run_git.call_args.args[0]
+
+    # Falls back to clone + checkout when the name is not a branch or tag
+    mock_run_git.reset_mock()
+    mock_run_git.side_effect = [subprocess.CalledProcessError(128, "git"), None, None]
+    git_service.clone_repository(repo_url, "release", tmp_path / "repo")
+
+    assert [c.args[0][:2] for c in mock_run_git.call_args_list] == [
+        ["git", "clone"],
+        ["git", "clone"],
+        ["git", "checkout"],
+    ]
+
+
+def test_clone_repository_commit_uses_shallow_partial_clone(
+    tmp_path: Path, mocker: MockerFixture
+):
+    mock_run_git = mocker.patch.object(git_service, "_run_git_quietly")
+    repo_url = "https://example.com/org/repo"
+    commit_hash = "ceca2ac4abc8055a7aeaa624ab68a460cd03ff1e"
+    target_path = tmp_path / "repo"
+
+    git_service.clone_repository(repo_url, commit_hash, target_path)
+
+    assert [c.args[0] for c in mock_run_git.call_args_list] == [
+        [
+            "git",
+            "clone",
+            "--quiet",
+            "--depth",
+            "1",
+            "--no-single-branch",
+            "--filter=blob:none",
+            "--no-checkout",
+            repo_url,
+            str(target_path),
+        ],
+        ["git", "checkout", "--quiet", commit_hash],
+    ]
+
+    # Commits behind the branch tips are fetched on their own, still shallow
+    mock_run_git.reset_mock()
+    mock_run_git.side_effect = [
+        None,
+        subprocess.CalledProcessError(1, "git"),
+        None,
+        None,
+    ]
+    git_service.clone_repository(repo_url, commit_hash, target_path)
+
+    assert mock_run_git.call_args_list[2].args[0] == [
+        "git",
+        "fetch",
+        "--quiet",
+        "--depth",
+        "1",
+        "origin",
+        commit_hash,
+    ]
+
+
+def test_clone_repository_reuses_cached_clone(tmp_path: Path, mocker: MockerFixture):
+    def _fake_clone_and_checkout(repo_url: str, commit_hash: str, target_path: Path):
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        subprocess.run([*git, "init", "-q", str(target_path)], check=True)
+        (target_path / "README.md").write_text("hello")
+        subprocess.run([*git, "add", "."], cwd=target_path, check=True)
+        subprocess.run([*git, "commit", "-qm", "init"], cwd=target_path, check=True)
+
+    mock_clone = mocker.patch.object(
+        git_service, "_clone_and_checkout", side_effect=_fake_clone_and_checkout
+    )
+    repo_url = "https://example.com/org/repo"
+    commit_hash = "ceca2ac4abc8055a7aeaa624ab68a460cd03ff1e"
+    cache_dir = tmp_path / "cache"
+
+    def _snapshot_cached_git_dir() -> dict[Path, bytes]:
+        (cached_path,) = cache_dir.iterdir()
+        git_dir = cached_path / ".git"
+        return {
+            path.relative_to(git_dir): path.read_bytes()
+            for path in git_dir.rglob("*")
+            if path.is_file()
+        }
+
+    repo_path = git_service.clone_repository(
+        repo_url, commit_hash, tmp_path / "first", cache_dir=cache_dir
+    )
+    assert (repo_path / "README.md").read_text() == "hello"
+    cached_git_dir = _snapshot_cached_git_dir()
+
+    repo_path = git_service.clone_repository(
+        repo_url, commit_hash, tmp_path / "second", cache_dir=cache_dir
+    )
+    assert (repo_path / "README.md").read_text() == "hello"
+
+    mock_clone.assert_called_once()
+    # Git writes in the clones (e.g. reflog appends) must not reach the cache
+    assert _snapshot_cached_git_dir() == cached_git_dir
+
+    # Modifying a clone must not leak into the cache
+    (tmp_path / "first" / "README.md").write_text("changed")
+    repo_path = git_service.clone_repository(
+        repo_url, commit_hash, tmp_path / "third", cache_dir=cache_dir
+    )
+    assert (repo_path / "README.md").read_text() == "hello"
+
+
+def test_clone_cache_evicts_unused_entries(tmp_path: Path, mocker: MockerFixture):
+    mocker.patch.object(git_service, "_clone_and_checkout")
+    cache_dir = tmp_path / "cache"
+    unused_entry = cache_dir / ("b" * 64)
+    unused_partial = cache_dir / f"{'c' * 64}.k3x_9q.tmp"
+    for entry in (unused_entry, unused_partial):
+        entry.mkdir(parents=True)
+        os.utime(entry, (0, 0))
+
+    cached_path = git_service._get_cached_clone(
+        "https://example.com/org/repo", "a" * 40, cache_dir
+    )
+
+    assert not unused_entry.exists()
+    assert not unused_partial.exists()
+    assert list(cache_dir.iterdir()) == [cached_path]
+
+
+def test_clone_cache_eviction_keeps_unrelated_directories(
+    tmp_path: Path, mocker: MockerFixture
+):
+    mocker.patch.object(git_service, "_clone_and_checkout")
+    cache_dir = tmp_path / "cache"
+    unrelated_file = cache_dir / "projects" / "thesis" / "draft.txt"
+    unrelated_file.parent.mkdir(parents=True)
+    unrelated_file.write_text("do not delete")
+    for path in (unrelated_file.parent, unrelated_file.parent.parent):
+        os.utime(path, (0, 0))
+
+    git_service._get_cached_clone("https://example.com/org/repo", "a" * 40, cache_dir)
+
+    assert unrelated_file.read_text() == "do not delete"
+
+
+def test_clone_cache_reraises_failed_rename(tmp_path: Path, mocker: MockerFixture):
+    mocker.patch.object(git_service, "_clone_and_checkout")
+    mocker.patch.object(Path, "rename", side_effect=PermissionError("denied"))
+    cache_dir = tmp_path / "cache"
+
+    with pytest.raises(PermissionError):
+        git_service._get_cached_clone(
+            "https://example.com/org/repo", "a" * 40, cache_dir
+        )
+
+    assert list(cache_dir.iterdir()) == []
+
+
 def test_walk_cad_manifest_components(examples_dir: Path, tmp_path: Path):
     """Test walking through CAD manifest components and validating with Pydantic model."""
     # Get the path to the test CAD manifest file
@@ -105,6 +294,310 @@ def test_walk_cad_manifest_components(examples_dir: Path, tmp_path: Path):
     assert file_count > 0, "Should find at least one file"
 
 
+def test_walk_manifest_components_depth_first_order():
+    def _component(component_id: str, *children: dict) -> dict:
+        return {
+            "id": component_id,
+            "type": "assembly" if children else "part",
+            "description": component_id,
+            "files": [],
+            "components": list(children),
+        }
+
+    manifest_data = {
+        "components": [
+            _component("A", _component("A1", _component("A1a")), _component("A2")),
+            _component("B"),
+        ]
+    }
+
+    walked = [
+        (component.id, component.parent_path)
+        for component in manifest_service.walk_manifest_components(manifest_data)
+    ]
+
+    assert walked == [
+        ("A", []),
+        ("A1", ["A"]),
+        ("A1a", ["A", "A1"]),
+        ("A2", ["A"]),
+        ("B", []),
+    ]
+
+
+@pytest.mark.parametrize(
+    "files, expected",
+    [
+        (
+            [".hornet/cad_manifest.json", "sim_manifest.json"],
+            (".hornet/cad_manifest.json", None),
+        ),
+        (
+            ["cad_manifest.json", "sim_manifest.json"],
+            ("cad_manifest.json", "sim_manifest.json"),
+        ),
+        ([".hornet/sim_manifest.json/"], (None, None)),
+        ([], (None, None)),
+    ],
+)
+def test_find_hornet_manifests(
+    tmp_path: Path, files: list[str], expected: tuple[str | None, str | None]
+):
+    for name in files:
+        file_path = tmp_path / name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if name.endswith("/"):
+            file_path.mkdir()
+        else:
+            file_path.touch()
+
+    hornet_manifests = manifest_service.find_hornet_manifests(tmp_path)
+    assert hornet_manifests == tuple(
+        tmp_path / name if name else None for name in expected
+    )
+    assert hornet_manifests.found() == [
+        (label, tmp_path / name)
+        for label, name in zip(("CAD", "SIM"), expected, strict=True)
+        if name
+    ]
+    assert manifest_service.find_hornet_manifests(tmp_path / "missing") == (None, None)
+
+
+def test_find_existing_files(tmp_path: Path):
+    existing = [tmp_path / f"part_{i}.step" for i in range(5)]
+    for file_path in existing:
+        file_path.touch()
+    missing = [tmp_path / "missing.step", tmp_path / "sub" / "missing.step"]
+
+    assert manifest_service.find_existing_files(existing + missing) == set(existing)
+    assert manifest_service.find_existing_files(missing[:1]) == set()
+    assert manifest_service.find_existing_files([]) == set()
+
+
+def test_find_existing_files_pools_only_larger_batches(
+    tmp_path: Path, mocker: MockerFixture
+):
+    executor_cls = mocker.patch.object(
+        manifest_service, "ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    )
+    file_paths = [tmp_path / f"part_{i}.step" for i in range(10)]
+    for file_path in file_paths[::2]:
+        file_path.touch()
+
+    few = file_paths[: manifest_service._THREADED_STAT_MIN_FILES - 1]
+    assert manifest_service.find_existing_files(few) == set(few[::2])
+    executor_cls.assert_not_called()
+
+    assert manifest_service.find_existing_files(file_paths) == set(file_paths[::2])
+    executor_cls.assert_called_once()
+
+
+def test_find_existing_files_large_batch(tmp_path: Path):
+    existing = []
+    for dir_name in ("a", "b"):
+        (tmp_path / dir_name).mkdir()
+        for i in range(40):
+            file_path = tmp_path / dir_name / f"part_{i}.step"
+            file_path.touch()
+            existing.append(file_path)
+    valid_link = tmp_path / "a" / "valid_link.step"
+    valid_link.symlink_to(existing[0])
+    broken_link = tmp_path / "a" / "broken_link.step"
+    broken_link.symlink_to(tmp_path / "nowhere.step")
+    missing = [tmp_path / "a" / "missing.step", tmp_path / "c" / "missing.step"]
+
+    file_paths = existing + [valid_link, broken_link] + missing
+    assert manifest_service.find_existing_files(file_paths) == {
+        *existing,
+        valid_link,
+    }
+
+
+@pytest.fixture
+def mock_schema_download(schema_dir: Path, mocker: MockerFixture) -> MagicMock:
+    schema_bytes = (schema_dir / "cad_manifest.schema.json").read_bytes()
+    mock_client = mocker.patch.object(manifest_service, "_http_client")
+    mock_get = mock_client.return_value.get
+    mock_get.return_value.content = schema_bytes
+    return mock_get
+
+
+def test_validate_manifest_schema_downloads_schema_once(
+    examples_dir: Path, schema_cache_dir: Path, mock_schema_download: MagicMock
+):
+    manifest_path = examples_dir / "cad_manifest.json"
+
+    manifest_service.validate_manifest_schema(manifest_path)
+    manifest_service.validate_manifest_schema(manifest_path)
+    assert mock_schema_download.call_count == 1
+
+    # A new process starts with no compiled validators but reuses the disk cache
+    manifest_service._SCHEMA_VALIDATORS.clear()
+    manifest_service.validate_manifest_schema(manifest_path)
+    assert mock_schema_download.call_count == 1
+    assert len(list(schema_cache_dir.glob("*[0-9a-f].json"))) == 1
+
+
+def test_http_client_is_shared_across_threads():
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = set(executor.map(lambda _: manifest_service._http_client(), range(8)))
+    assert clients == {manifest_service._http_client()}
+
+
+def test_validate_manifests_collects_errors_in_order(
+    examples_dir: Path,
+    tmp_path: Path,
+    schema_cache_dir: Path,
+    mock_schema_download: MagicMock,
+):
+    no_schema_manifest = tmp_path / "sim_manifest.json"
+    no_schema_manifest.write_text("{}")
+    manifests = [
+        ("CAD", examples_dir / "cad_manifest.json"),
+        ("SIM", no_schema_manifest),
+    ]
+
+    errors = manifest_service.validate_manifests(manifests)
+    assert len(errors) == 1
+    assert errors[0].startswith("SIM manifest validation failed: No $schema")
+
+    with pytest.raises(FileNotFoundError):
+        manifest_service.validate_manifests(manifests, fail_fast=True)
+
+
+def test_validate_manifest_schema_compiles_validator_once(
+    examples_dir: Path,
+    schema_cache_dir: Path,
+    mock_schema_download: MagicMock,
+    mocker: MockerFixture,
+):
+    compile_spy = mocker.spy(manifest_service, "_compile_schema_validator")
+    manifest_path = examples_dir / "cad_manifest.json"
+
+    manifest_service.validate_manifest_schema(manifest_path)
+    manifest_service.validate_manifest_schema(manifest_path)
+
+    assert compile_spy.call_count == 1
+
+
+def test_is_manifest_schema_valid(
+    examples_dir: Path,
+    tmp_path: Path,
+    schema_cache_dir: Path,
+    mock_schema_download: MagicMock,
+):
+    manifest_path = examples_dir / "cad_manifest.json"
+    assert manifest_service.is_manifest_schema_valid(manifest_path)
+
+    manifest_data = orjson.loads(manifest_path.read_bytes())
+    del manifest_data["components"][0]["id"]
+    invalid_manifest_path = tmp_path / "cad_manifest.json"
+    invalid_manifest_path.write_bytes(orjson.dumps(manifest_data))
+    assert not manifest_service.is_manifest_schema_valid(invalid_manifest_path)
+
+
+def test_validate_manifest_schema_downloads_each_schema_once(
+    examples_dir: Path, schema_dir: Path, schema_cache_dir: Path, mocker: MockerFixture
+):
+    def _get(schema_url: str, **kwargs) -> MagicMock:
+        response = MagicMock()
+        response.content = (schema_dir / schema_url.rsplit("/", 1)[-1]).read_bytes()
+        return response
+
+    mock_client = mocker.patch.object(manifest_service, "_http_client")
+    mock_client.return_value.get.side_effect = _get
+
+    manifest_names = ("cad_manifest.json", "sim_manifest.json")
+    for manifest_name in manifest_names * 3:
+        manifest_service.validate_manifest_schema(examples_dir / manifest_name)
+
+    assert mock_client.return_value.get.call_count == len(manifest_names)
+
+
+def test_validate_manifest_schema_revalidates_stale_cache(
+    examples_dir: Path,
+    schema_cache_dir: Path,
+    mock_schema_download: MagicMock,
+    mocker: MockerFixture,
+):
+    manifest_path = examples_dir / "cad_manifest.json"
+    mock_schema_download.return_value.headers = {"etag": '"v1"'}
+    manifest_service.validate_manifest_schema(manifest_path)
+
+    # Expire the cache entry and start a new process
+    (cached_schema,) = schema_cache_dir.glob("*[0-9a-f].json")
+    os.utime(cached_schema, (0, 0))
+    manifest_service._SCHEMA_VALIDATORS.clear()
+
+    mock_schema_download.return_value.status_code = 304
+    read_spy = mocker.spy(orjson, "loads")
+    manifest_service.validate_manifest_schema(manifest_path)
+
+    assert mock_schema_download.call_args.kwargs["headers"] == {"if-none-match": '"v1"'}
+    assert cached_schema.stat().st_mtime > 0
+    # manifest, cached schema and its headers are each parsed once
+    assert read_spy.call_count == 3
+
+
+def test_validate_manifest_schema_uses_stale_cache_when_offline(
+    examples_dir: Path, schema_cache_dir: Path, mock_schema_download: MagicMock
+):
+    manifest_path = examples_dir / "cad_manifest.json"
+    manifest_service.validate_manifest_schema(manifest_path)
+
+    # Expire the cache entry, start a new process and lose the network
+    (cached_schema,) = schema_cache_dir.glob("*[0-9a-f].json")
+    os.utime(cached_schema, (0, 0))
+    manifest_service._SCHEMA_VALIDATORS.clear()
+    mock_schema_download.side_effect = httpx.ConnectError("offline")
+
+    manifest_service.validate_manifest_schema(manifest_path)
+    assert mock_schema_download.call_count == 2
+
+    # Without a cache entry the download error still surfaces
+    cached_schema.unlink()
+    manifest_service._SCHEMA_VALIDATORS.clear()
+    with pytest.raises(httpx.ConnectError):
+        manifest_service.validate_manifest_schema(manifest_path)
+
+
+def test_validate_manifest_schema_refetches_unreadable_cache(
+    examples_dir: Path, schema_cache_dir: Path, mock_schema_download: MagicMock
+):
+    manifest_path = examples_dir / "cad_manifest.json"
+    mock_schema_download.return_value.headers = {"etag": '"v1"'}
+    manifest_service.validate_manifest_schema(manifest_path)
+
+    # Corrupt the cached body but keep its validators, then start a new process
+    (cached_schema,) = schema_cache_dir.glob("*[0-9a-f].json")
+    cached_schema.write_bytes(b"{not json")
+    manifest_service._SCHEMA_VALIDATORS.clear()
+
+    manifest_service.validate_manifest_schema(manifest_path)
+
+    # A 304 could not be served from the cache, so the schema is fetched in full
+    assert mock_schema_download.call_args.kwargs["headers"] == {}
+    assert manifest_service._read_cached_schema(mock_schema_download.call_args.args[0])
+
+
+def test_validate_manifest_schema_without_home_skips_disk_cache(
+    examples_dir: Path,
+    mock_schema_download: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+):
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(manifest_service, "_SCHEMA_VALIDATORS", {})
+    mocker.patch.object(Path, "home", side_effect=RuntimeError("no home"))
+    mock_write = mocker.patch.object(manifest_service, "_write_cache_file")
+
+    manifest_service.validate_manifest_schema(examples_dir / "cad_manifest.json")
+
+    assert manifest_service._get_schema_cache_dir() is None
+    assert mock_schema_download.call_args.kwargs["headers"] == {}
+    mock_write.assert_not_called()
+
+
 def _validate_manifest_files(
     manifest_path: Path, repo_path: Path
 ) -> tuple[list[str], list[str]]:
@@ -211,6 +704,49 @@ def test_repository_manifest_validation(tmp_path: Path, repo_id: str, metadata:
     manifest_service.validate_manifest_schema(sim_manifest)
 
 
+@pytest.fixture
+def simple_cad_repo(examples_dir: Path, tmp_path: Path) -> Path:
+    repo_path = tmp_path / "cad-project"
+    manifest_path = repo_path / ".hornet" / "cad_manifest.json"
+    manifest_path.parent.mkdir(parents=True)
+    manifest_bytes = (examples_dir / "simple_cad_manifest.json").read_bytes()
+    manifest_path.write_bytes(manifest_bytes)
+
+    manifest_data = json.loads(manifest_bytes)
+    for component in manifest_service.walk_manifest_components(manifest_data):
+        for file_obj in component.files:
+            file_path = repo_path / file_obj.path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.touch()
+    return repo_path
+
+
+def test_process_manifest_with_debug_plugin(simple_cad_repo: Path):
+    processor = ManifestProcessor("debug", logging.getLogger(__name__))
+    manifest_path = simple_cad_repo / ".hornet" / "cad_manifest.json"
+    release = model.Release(
+        origin="GitHub",
+        url="https://github.com/myorg/cad-project",
+        label="main",
+        marker="ceca2ac4abc8055a7aeaa624ab68a460cd03ff1e",
+    )
+
+    assert processor.process_manifest(
+        manifest_path, simple_cad_repo, fail_fast=True, repo_release=release
+    ) == (2, 2)
+
+    # Name filter matches case-insensitively; total still counts all components
+    assert processor.process_manifest(
+        manifest_path, simple_cad_repo, name_filter="SIMPLEPART", repo_release=release
+    ) == (1, 2)
+
+    (simple_cad_repo / "exports" / "SimplePart.step").unlink()
+    with pytest.raises(FileNotFoundError, match="SimplePart.step"):
+        processor.process_manifest(
+            manifest_path, simple_cad_repo, fail_fast=True, repo_release=release
+        )
+
+
 def test_lifespan_in_contextmanager(caplog: pytest.LogCaptureFixture):
     """Test that log_lifespan logs start and end of context, including when exceptions are raised."""
 
@@ -250,3 +786,16 @@ def test_lifespan_in_contextmanager(caplog: pytest.LogCaptureFixture):
     assert "Action [raised]" in caplog.records[1].message
     assert "test exception" in caplog.records[1].message
     assert "Action [done]" in caplog.records[2].message
+
+
+def test_watch_for_metadata_validates_inputs_dir(tmp_path: Path):
+    inputs_file = tmp_path / "inputs.txt"
+    inputs_file.touch()
+    work_dir = tmp_path / "work"
+
+    with pytest.raises(FileNotFoundError):
+        watcher.watch_for_metadata(tmp_path / "missing", work_dir)
+    with pytest.raises(FileNotFoundError):
+        watcher.watch_for_metadata(inputs_file / "sub", work_dir)
+    with pytest.raises(NotADirectoryError):
+        watcher.watch_for_metadata(inputs_file, work_dir)